@@ -1,6 +1,5 @@
 """Generate sample data."""
 
-import matplotlib.pyplot as plt
 import numpy as np
 import json
 
@@ -42,6 +41,9 @@ def gen_sine(plot=False):
 
 
 def plot_func(data):
+    # Imported here so that generating data does not load matplotlib
+    import matplotlib.pyplot as plt
+
     plt.plot(data['x'], data['y'])
     plt.show()
 
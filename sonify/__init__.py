@@ -0,0 +1 @@
+"""Sonify 2D data as harmonic voices."""
@@ -1,6 +1,10 @@
 """This module creates voices that can be used by the sound module to sonify."""
 
 
+class VoiceRangeError(ValueError):
+    """Raised when the voices of a track would go above C8."""
+
+
 class Track:
     """Class that handles a track with various harmonic voices.
 
@@ -44,12 +48,6 @@ class Track:
             interval_type = interval_type.lower()
             self._interval_type = self._interval_switcher(interval_type)
 
-        # Validate and assign number of voices and octave
-        if self._validate_num_voices_and_octave(num_voices, octave, self._interval_type):
-            self._octave = octave
-            self._num_voices = num_voices
-            self._voices = []
-
         # Validate and assign key
         if self._validate_key(key):
             self._key = key.upper()
@@ -62,6 +60,13 @@ class Track:
             elif mode == 'minor':
                 self._mode = Track.MINOR
 
+        # Validate and assign number of voices and octave last, so that an invalid
+        # key or mode is reported before the range check
+        if self._validate_num_voices_and_octave(num_voices, octave, self._interval_type):
+            self._octave = octave
+            self._num_voices = num_voices
+            self._voices = []
+
         self._create_voices()
 
         # Print results
@@ -114,8 +119,8 @@ class Track:
             TypeError: Octave type error, integer expected.
             ValueError: Octave out of range. Select octave inbetween 1 and 7.
             ValueError: Number of voices cannot be 0 or less than 0.
-            ValueError: Range too high. Reduce the number of voices, lower the starting octave,
-                        or choose a larger interval type.
+            VoiceRangeError: Range too high. Reduce the number of voices, lower the starting octave,
+                             or choose a larger interval type.
 
         """
         try:
@@ -134,8 +139,8 @@ class Track:
             num_extra_octaves = int(num_voices / len(interval_type)) + int(num_voices % len(interval_type) > 0)
 
             if num_extra_octaves + octave - 1 > 7:
-                raise ValueError("Range too high. Reduce the number of voices, "
-                                 "lower the starting octave, or choose a larger interval type.")
+                raise VoiceRangeError("Range too high. Reduce the number of voices, "
+                                      "lower the starting octave, or choose a larger interval type.")
 
             return True
 
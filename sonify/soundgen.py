@@ -1,7 +1,6 @@
 """Generate sonified sound from data."""
 
 import numpy as np
-from scipy.io.wavfile import write
 
 fs = 44100
 
@@ -36,4 +35,6 @@ def render_track(track):
 
 
 def play_track(track):
+    # Imported here so that importing this module does not load SciPy
+    from scipy.io.wavfile import write
     write('test.wav', fs, track)
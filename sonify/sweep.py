@@ -0,0 +1,89 @@
+"""Render a data set across many Track configurations, sharing intermediate results."""
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from sonify.arrangement import Track, VoiceRangeError
+from sonify import dataproccess as dp
+from sonify import soundgen as sg
+
+
+def sweep(data, num_voices, keys, modes, octaves, interval_types,
+          track_len, block_percent, overlap_percent, max_workers=None):
+    """Render every combination of the given Track parameters.
+
+    The pipeline is split into stages and each stage is keyed only on the
+    parameters it depends on:
+
+        num_voices -> quantized data -> sonification matrix -> envelope
+        (num_voices, key, mode, octave, interval_type) -> frequencies
+        frequency -> sine tone
+        envelope + tones -> rendered track
+
+    The envelope is the sonification matrix stretched over the track length,
+    so it is computed once per number of voices, and each sine tone is
+    computed once per distinct frequency. Only the final mix and render is
+    done per configuration, and that fan-out runs on a thread pool.
+
+    All intermediates and results are held in memory at once. The tone cache
+    takes track_len * fs * 8 bytes per distinct frequency, up to 85 notes
+    between C1 and C8 (about 1.8 GB for a 60 second track), and each rendered
+    track takes track_len * fs * 2 bytes. Split large sweeps into several
+    calls to bound memory.
+
+    Args:
+        data (dict): Raw data with 'x' and 'y' lists.
+        num_voices (int or list): Number(s) of voices.
+        keys (list): Keys to sweep.
+        modes (list): Modes to sweep.
+        octaves (list): Starting octaves to sweep.
+        interval_types (list): Interval types to sweep.
+        track_len (int): Track length in seconds.
+        block_percent (float): Block size as a fraction of the data length.
+        overlap_percent (float): Overlap between consecutive blocks.
+        max_workers (int): Number of threads for the render stage.
+
+    Returns:
+        dict: Rendered tracks keyed by (num_voices, key, mode, octave, interval_type).
+              Combinations whose voices would go above C8 are left out.
+
+    Raises:
+        TypeError: Any swept value has the wrong type.
+        ValueError: Any swept value is invalid on its own.
+
+    """
+    if np.ndim(num_voices) == 0:
+        num_voices = [num_voices]
+
+    # Voice frequencies for every combination within range
+    configs = {}
+    for config in itertools.product(num_voices, keys, modes, octaves, interval_types):
+        try:
+            configs[config] = Track(*config).voice_freqs
+        except VoiceRangeError:
+            continue
+
+    # Envelope per number of voices
+    envelopes = {}
+    for voices in {config[0] for config in configs}:
+        quantized = dp.norm_and_quantize_data(data, voices)
+        son_mat = dp.gen_sonification_mat(quantized, voices, block_percent, overlap_percent)
+        envelopes[voices] = sg.sonify_data(np.ones((track_len * sg.fs, voices)), son_mat)
+
+    # Sine tone per distinct frequency
+    tones = {}
+    for freqs in configs.values():
+        for freq in freqs:
+            if freq not in tones:
+                tones[freq] = sg.arrange_harmonies([freq], track_len)[:, 0]
+
+    def render(config):
+        track = np.column_stack([tones[freq] for freq in configs[config]])
+        track *= envelopes[config[0]]
+        return sg.render_track(track)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        rendered = executor.map(render, configs)
+        return dict(zip(configs, rendered))
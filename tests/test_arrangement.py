@@ -6,7 +6,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import unittest  # noqa
 
-from sonify.arrangement import Track  # noqa
+from sonify.arrangement import Track, VoiceRangeError  # noqa
 
 
 class TestArrangement(unittest.TestCase):
@@ -36,7 +36,7 @@ class TestArrangement(unittest.TestCase):
         trck = Track(1, 'C', 'major', 5, 'octave')
         trck.num_voices = 3
 
-        with self.assertRaises(ValueError) as error:
+        with self.assertRaises(VoiceRangeError) as error:
             trck.num_voices = 4
         self.assertEqual('Range too high. Reduce the number of voices, lower the starting octave, '
                          'or choose a larger interval type.', str(error.exception))
@@ -118,6 +118,10 @@ class TestArrangement(unittest.TestCase):
             trck.key = 'H'
         self.assertEqual('Key is invalid.', str(error.exception))
 
+        with self.assertRaises(ValueError) as error:
+            Track(5, 'H', 'major', 7, 'octave')
+        self.assertEqual('Key is invalid.', str(error.exception))
+
         with self.assertRaises(TypeError) as error:
             trck.key = 1
         self.assertEqual('Key type error, string expected.', str(error.exception))
@@ -0,0 +1,73 @@
+"""Unit tests for dataproccess module."""
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest  # noqa
+
+import numpy as np  # noqa
+
+from sonify import dataproccess as dp  # noqa
+from tests import reference  # noqa
+
+NUM_TRIALS = 50
+
+
+def random_data(rng):
+    data_len = int(rng.integers(2, 300))
+    x = np.sort(rng.uniform(-100, 100, data_len))
+    y = rng.normal(0, rng.uniform(0.1, 100), data_len)
+    y[rng.integers(data_len)] = y.max() + 1
+    return {'x': x.tolist(), 'y': y.tolist()}
+
+
+class TestDataProcess(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_norm_and_quantize_data(self):
+        for trial in range(NUM_TRIALS):
+            data = random_data(self.rng)
+            num_voices = int(self.rng.integers(1, 32))
+            with self.subTest(trial=trial):
+                quantized = dp.norm_and_quantize_data(data, num_voices)
+                np.testing.assert_array_equal(reference.norm_and_quantize_data(data, num_voices), quantized)
+                self.assertEqual(1, quantized[1].min())
+                self.assertEqual(num_voices, quantized[1].max())
+
+    def test_gen_sonification_mat(self):
+        for trial in range(NUM_TRIALS):
+            num_voices = int(self.rng.integers(1, 32))
+            data = reference.norm_and_quantize_data(random_data(self.rng), num_voices)
+            block_percent = self.rng.uniform(0.01, 1)
+            overlap_percent = self.rng.uniform(0, 0.95)
+            with self.subTest(trial=trial):
+                try:
+                    expected = reference.gen_sonification_mat(data, num_voices, block_percent, overlap_percent)
+                except ValueError as error:
+                    with self.assertRaises(ValueError) as actual:
+                        dp.gen_sonification_mat(data, num_voices, block_percent, overlap_percent)
+                    self.assertEqual(str(error), str(actual.exception))
+                    continue
+
+                son_mat = dp.gen_sonification_mat(data, num_voices, block_percent, overlap_percent)
+                np.testing.assert_allclose(son_mat, expected, rtol=1e-12, atol=0)
+                np.testing.assert_allclose(son_mat.sum(axis=1), 1)
+
+    def test_block_and_overlap_errors(self):
+        data = reference.norm_and_quantize_data(random_data(self.rng), 4)
+
+        with self.assertRaises(ValueError) as error:
+            dp.gen_sonification_mat(data, 4, 0, 0.5)
+        self.assertEqual('Block length is zero. Choose a larger block percentage.', str(error.exception))
+
+        with self.assertRaises(ValueError) as error:
+            dp.gen_sonification_mat(data, 4, 0.5, 1)
+        self.assertEqual('Overlap length is equal to the block length. Choose a smaller overlap percentage.',
+                         str(error.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
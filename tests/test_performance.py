@@ -0,0 +1,191 @@
+"""Performance regression tests for the render pipeline.
+
+Timings are compared against the frozen reference implementations on the same
+machine, taking the best of several runs, so the tolerance bands hold across
+hardware. Peak memory is measured with tracemalloc, which numpy reports to.
+
+Timing and memory tests only run when SONIFY_BENCHMARK is set, e.g.
+
+    SONIFY_BENCHMARK=1 python -m pytest tests/test_performance.py
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import importlib.util  # noqa
+import itertools  # noqa
+import subprocess  # noqa
+import time  # noqa
+import tracemalloc  # noqa
+import unittest  # noqa
+
+import numpy as np  # noqa
+
+from sonify.arrangement import Track  # noqa
+from sonify import dataproccess as dp  # noqa
+from sonify import soundgen as sg  # noqa
+from sonify.sweep import sweep  # noqa
+from tests import reference  # noqa
+
+benchmark = unittest.skipUnless(os.environ.get('SONIFY_BENCHMARK'), 'set SONIFY_BENCHMARK to run benchmarks')
+
+NUM_RUNS = 5
+
+# A fast path may be at most this much slower than the reference
+TIME_TOLERANCE = 1.5
+# The sweep must take at most this fraction of the naive loop
+SWEEP_TIME_RATIO = 0.75
+# Startup and a 1 second render must take at most this fraction of the same job
+# with SciPy imported eagerly
+STARTUP_TIME_RATIO = 0.9
+# Peak memory may exceed the estimated working set by at most this factor
+MEMORY_TOLERANCE = 1.5
+
+NUM_VOICES = 8
+TRACK_LEN = 1
+KEYS = ['C', 'D', 'E', 'F', 'G', 'A']
+MODES = ['major', 'minor']
+OCTAVES = [3]
+INTERVAL_TYPES = ['triad', 'fifth', 'all']
+NUM_WORKERS = 4
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+WORKER = '''
+import sys
+sys.path.insert(0, {root!r})
+{preload}
+from sonify.arrangement import Track
+from sonify import dataproccess as dp
+from sonify import soundgen as sg
+import numpy as np
+
+x = np.arange(0, 10, 0.1)
+data = dp.norm_and_quantize_data({{'x': x, 'y': np.sin(x)}}, 4)
+data = dp.gen_sonification_mat(data, 4, 0.1, 0.5)
+track = sg.arrange_harmonies(Track(4, 'C', 'major', 4, 'triad').voice_freqs, 1)
+sg.render_track(sg.sonify_data(track, data))
+'''
+
+
+def run_worker(preload=''):
+    subprocess.run([sys.executable, '-c', WORKER.format(root=ROOT, preload=preload)], check=True)
+
+
+def best_time(func, *args):
+    times = []
+    for _ in range(NUM_RUNS):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def peak_memory(func, *args):
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestPerformance(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        x = np.arange(0, 100, 0.1)
+        self.data = {'x': x.tolist(), 'y': (np.sin(x) + rng.normal(0, 0.1, len(x))).tolist()}
+        self.quantized = dp.norm_and_quantize_data(self.data, NUM_VOICES)
+        self.son_mat = dp.gen_sonification_mat(self.quantized, NUM_VOICES, 0.1, 0.5)
+        self.freqs = Track(NUM_VOICES, 'C', 'major', 3, 'triad').voice_freqs
+        self.track = sg.arrange_harmonies(self.freqs, TRACK_LEN)
+
+    def assertNotSlower(self, func, reference_func, *args):
+        actual = best_time(func, *args)
+        expected = best_time(reference_func, *args)
+        self.assertLessEqual(actual, expected * TIME_TOLERANCE,
+                             '{} took {:.4f}s, reference {:.4f}s'.format(func.__name__, actual, expected))
+
+    @benchmark
+    def test_gen_sonification_mat_time(self):
+        self.assertNotSlower(dp.gen_sonification_mat, reference.gen_sonification_mat,
+                             self.quantized, NUM_VOICES, 0.01, 0.5)
+
+    @benchmark
+    def test_arrange_harmonies_time(self):
+        self.assertNotSlower(sg.arrange_harmonies, reference.arrange_harmonies, self.freqs, TRACK_LEN)
+
+    @benchmark
+    def test_sonify_data_time(self):
+        self.assertNotSlower(lambda: sg.sonify_data(self.track.copy(), self.son_mat),
+                             lambda: reference.sonify_data(self.track.copy(), self.son_mat))
+
+    @benchmark
+    def test_render_track_time(self):
+        self.assertNotSlower(sg.render_track, reference.render_track, self.track)
+
+    def _sweep(self):
+        return sweep(self.data, NUM_VOICES, KEYS, MODES, OCTAVES, INTERVAL_TYPES, TRACK_LEN, 0.1, 0.5,
+                     max_workers=NUM_WORKERS)
+
+    def _reference_sweep(self):
+        rendered = {}
+        for key in KEYS:
+            for mode in MODES:
+                for octave in OCTAVES:
+                    for interval_type in INTERVAL_TYPES:
+                        config = (NUM_VOICES, key, mode, octave, interval_type)
+                        freqs = Track(*config).voice_freqs
+                        rendered[config] = reference.render(self.data, freqs, NUM_VOICES, TRACK_LEN, 0.1, 0.5)
+        return rendered
+
+    def test_sweep_equivalence(self):
+        expected = self._reference_sweep()
+        actual = self._sweep()
+        self.assertEqual(list(expected), list(actual))
+        for config in expected:
+            np.testing.assert_array_equal(expected[config], actual[config])
+
+    @benchmark
+    def test_sweep_time(self):
+        actual = best_time(self._sweep)
+        expected = best_time(self._reference_sweep)
+        self.assertLessEqual(actual, expected * SWEEP_TIME_RATIO,
+                             'sweep took {:.4f}s, reference {:.4f}s'.format(actual, expected))
+
+    @benchmark
+    def test_sweep_memory(self):
+        configs = list(itertools.product([NUM_VOICES], KEYS, MODES, OCTAVES, INTERVAL_TYPES))
+        num_tones = len({freq for config in configs for freq in Track(*config).voice_freqs})
+        num_samples = TRACK_LEN * sg.fs
+        # Cached tones and envelope, a float64 mix and sum per worker, and the int16 outputs
+        estimate = (num_tones + NUM_VOICES) * num_samples * 8 \
+            + NUM_WORKERS * (NUM_VOICES + 1) * num_samples * 8 \
+            + len(configs) * num_samples * 2
+        peak = peak_memory(self._sweep)
+        self.assertLessEqual(peak, estimate * MEMORY_TOLERANCE,
+                             'sweep peak memory {} bytes, estimate {} bytes'.format(peak, estimate))
+
+    def test_lightweight_imports(self):
+        script = ('import sys, runpy\n'
+                  'sys.path.insert(0, {root!r})\n'
+                  'import sonify, sonify.soundgen, sonify.sweep\n'
+                  'runpy.run_path({gen!r})\n'
+                  'print(sorted(mod for mod in sys.modules if mod.split(".")[0] in ("scipy", "matplotlib")))')
+        script = script.format(root=ROOT, gen=os.path.join(ROOT, 'data', 'gen_sample_data.py'))
+        output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True)
+        self.assertEqual('[]', output.stdout.strip())
+
+    @benchmark
+    @unittest.skipIf(importlib.util.find_spec('scipy') is None, 'SciPy is not installed')
+    def test_worker_startup_time(self):
+        actual = best_time(run_worker)
+        expected = best_time(run_worker, 'import scipy.io.wavfile')
+        self.assertLessEqual(actual, expected * STARTUP_TIME_RATIO,
+                             'worker took {:.4f}s, with SciPy {:.4f}s'.format(actual, expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
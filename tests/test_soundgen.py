@@ -0,0 +1,59 @@
+"""Unit tests for soundgen module."""
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest  # noqa
+
+import numpy as np  # noqa
+
+from sonify import soundgen as sg  # noqa
+from tests import reference  # noqa
+
+NUM_TRIALS = 20
+
+
+class TestSoundGen(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def random_track(self):
+        num_voices = int(self.rng.integers(1, 17))
+        return self.rng.uniform(-1, 1, (int(self.rng.integers(1, 3)) * sg.fs, num_voices))
+
+    def random_son_mat(self, num_voices):
+        son_mat = self.rng.uniform(0, 1, (int(self.rng.integers(1, 500)), num_voices + 1))
+        return son_mat / son_mat.sum(axis=1, keepdims=True)
+
+    def test_arrange_harmonies(self):
+        for trial in range(NUM_TRIALS):
+            freqs = self.rng.uniform(30, 4200, int(self.rng.integers(1, 17))).round(2).tolist()
+            track_len = int(self.rng.integers(1, 3))
+            with self.subTest(trial=trial):
+                track = sg.arrange_harmonies(freqs, track_len)
+                self.assertEqual((track_len * sg.fs, len(freqs)), track.shape)
+                np.testing.assert_allclose(track, reference.arrange_harmonies(freqs, track_len), rtol=0, atol=1e-9)
+
+    def test_sonify_data(self):
+        for trial in range(NUM_TRIALS):
+            track = self.random_track()
+            son_mat = self.random_son_mat(track.shape[1])
+            with self.subTest(trial=trial):
+                expected = reference.sonify_data(track.copy(), son_mat)
+                np.testing.assert_allclose(sg.sonify_data(track.copy(), son_mat), expected, rtol=1e-12, atol=0)
+
+    def test_render_track(self):
+        for trial in range(NUM_TRIALS):
+            track = self.random_track()
+            with self.subTest(trial=trial):
+                rendered = sg.render_track(track.copy())
+                self.assertEqual(np.int16, rendered.dtype)
+                self.assertEqual(32767, np.abs(rendered).max())
+                diff = rendered.astype(int) - reference.render_track(track.copy())
+                self.assertLessEqual(np.abs(diff).max(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
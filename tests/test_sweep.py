@@ -0,0 +1,67 @@
+"""Unit tests for sweep module."""
+
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest  # noqa
+
+import numpy as np  # noqa
+
+from sonify.arrangement import Track  # noqa
+from sonify.sweep import sweep  # noqa
+from tests import reference  # noqa
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        x = np.arange(0, 10, 0.1)
+        self.data = {'x': x.tolist(), 'y': np.sin(x).tolist()}
+
+    def _render(self, num_voices, key, mode, octave, interval_type):
+        freqs = Track(num_voices, key, mode, octave, interval_type).voice_freqs
+        return reference.render(self.data, freqs, num_voices, 1, 0.1, 0.5)
+
+    def test_matches_pipeline(self):
+        result = sweep(self.data, [3, 4], ['C', 'F#'], ['major', 'minor'], [3], ['triad', 'fifth'],
+                       1, 0.1, 0.5, max_workers=2)
+        self.assertEqual(16, len(result))
+        for config, rendered in result.items():
+            np.testing.assert_array_equal(self._render(*config), rendered)
+
+    def test_out_of_range_configs_skipped(self):
+        result = sweep(self.data, 4, ['C'], ['major'], [4, 7], ['octave'], 1, 0.1, 0.5)
+        self.assertEqual([(4, 'C', 'major', 4, 'octave')], list(result))
+
+        result = sweep(self.data, 4, ['C', 'D'], ['major'], [6, 7], ['octave'], 1, 0.1, 0.5)
+        self.assertEqual({}, result)
+
+    def test_invalid_values_raise(self):
+        with self.assertRaises(ValueError) as error:
+            sweep(self.data, 4, ['C', 'H'], ['major'], [4], ['triad'], 1, 0.1, 0.5)
+        self.assertEqual('Key is invalid.', str(error.exception))
+
+        with self.assertRaises(ValueError) as error:
+            sweep(self.data, 4, ['H'], ['major'], [7], ['octave'], 1, 0.1, 0.5)
+        self.assertEqual('Key is invalid.', str(error.exception))
+
+        with self.assertRaises(ValueError) as error:
+            sweep(self.data, 4, ['C'], ['majr'], [4], ['triad'], 1, 0.1, 0.5)
+        self.assertEqual('Invalid mode. Choose between major or minor.', str(error.exception))
+
+        with self.assertRaises(ValueError) as error:
+            sweep(self.data, 4, ['C'], ['major'], [4], ['tirad'], 1, 0.1, 0.5)
+        self.assertEqual('Invalid interval type.', str(error.exception))
+
+        with self.assertRaises(ValueError) as error:
+            sweep(self.data, 4, ['C'], ['major'], [4, 9], ['octave'], 1, 0.1, 0.5)
+        self.assertEqual('Octave out of range. Select octave in between 1 and 7.', str(error.exception))
+
+        with self.assertRaises(TypeError) as error:
+            sweep(self.data, np.int64(4), ['C'], ['major'], [4], ['triad'], 1, 0.1, 0.5)
+        self.assertEqual('Number of voices type error, integer expected.', str(error.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()